@@ -6,7 +6,7 @@ import json
 from re import compile
 from typing import Callable
 
-from .common import get_complete_url, get_response, common_client
+from .common import get_complete_url, get_response, common_client, project
 
 
 def get_canvas_client(access_token:str, base_url:str) -> Callable:
@@ -19,7 +19,7 @@ def get_canvas_client(access_token:str, base_url:str) -> Callable:
     headers = {'Authorization': f'Bearer {access_token}'}
     rx = compile(r"<(.*?)>; rel=\"(\w+)\"")
 
-    def canvas_client(method, path="/", parameters=None, url=None, data=None, resource=False):
+    def canvas_client(method, path="/", parameters=None, url=None, data=None, resource=False, fields=None):
         """REST tool to interact with Canvas API.
 
         The path parameters should always start with a "/" and should include the version (eg: `/api/v1/accounts`)
@@ -29,6 +29,7 @@ def get_canvas_client(access_token:str, base_url:str) -> Callable:
         :param url: if specified, path and parameters will be ignored (this should be a full URL, eg. `https://example.instructure.com/api/v1/accounts`)
         :param data: the optional body content of a POST/PATCH/PUT request. It will be form-encoded.
         :param resource: if true & method is GET, the client will request all the paginated content (it will make 1+ requests as needed). 
+        :param fields: if set together with `resource`, every record is reduced to these fields (see `common.project`).
         """
         if method.lower() == "get" and resource:
             resources = []
@@ -39,7 +40,7 @@ def get_canvas_client(access_token:str, base_url:str) -> Callable:
                 links = {rel: url for url, rel in rx.findall(link_header)}
                 contents = response.text
                 if contents:
-                    resources.extend(json.loads(contents))
+                    resources.extend(project(json.loads(contents), fields))
                 next_url = links.get('next')
 
             return resources
@@ -1,11 +1,14 @@
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
+from http.cookiejar import DefaultCookiePolicy
 import json
 import logging
-from typing import Any, Mapping, Optional
+from threading import Lock
+from typing import Any, Iterable, Mapping, Optional, Sequence
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger('rest_tools')
@@ -14,6 +17,13 @@ POST = "post"
 PUT = "put"
 PATCH = "patch"
 DELETE = "delete"
+POOL_CONNECTIONS = 100  # number of hosts whose connection pool is kept
+POOL_MAXSIZE = 10  # connections kept alive for each host
+
+_session = None
+_pool_maxsize = 0
+_pool_connections = 0
+_session_lock = Lock()
 
 
 def cache(fn):
@@ -34,23 +44,145 @@ def cache(fn):
 
 
 def expiring(getter):
-    """ This decorator employs a single cache on the wrapped fn that expires
-        after the number of seconds that the `getter` fn returns.
+    """ This decorator employs a cache on the wrapped fn, one entry for each set
+        of arguments, that expires after the number of seconds that the `getter` fn returns.
     """
     def inner_fn(f):
-        f.expiry = None
-        f.result = None
+        # key -> {'lock', 'expiry', 'result'}; an entry is only removed while its lock is held
+        entries = {}
+        lock = Lock()
+
+        def evict_expired(now, current):
+            # drop the expired entries, so that stale credentials don't pile up;
+            # the busy ones (eg. being refreshed) are left alone
+            for key, entry in list(entries.items()):
+                if entry is current or not entry['expiry'] or entry['expiry'] > now:
+                    continue
+                if entry['lock'].acquire(blocking=False):
+                    try:
+                        del entries[key]
+                    finally:
+                        entry['lock'].release()
+
         @wraps(f)
         def wrapper(*args, **kwargs):
-            if f.result and f.expiry and f.expiry > datetime.now():
-                return f.result
-            f.result = f(*args, **kwargs)
-            f.expiry = datetime.now() + timedelta(seconds=getter(f.result))
-            return f.result
+            key = (args, tuple(sorted(kwargs.items())))
+            while True:
+                with lock:
+                    entry = entries.setdefault(key, {'lock': Lock(), 'expiry': None, 'result': None})
+                # concurrent calls with the same arguments wait for a single result
+                with entry['lock']:
+                    with lock:
+                        if entries.get(key) is not entry:
+                            # evicted while waiting, start over with the current entry
+                            continue
+                    if entry['result'] and entry['expiry'] > datetime.now():
+                        return entry['result']
+                    try:
+                        result = f(*args, **kwargs)
+                    except Exception:
+                        with lock:
+                            if not entry['result']:
+                                del entries[key]
+                        raise
+                    now = datetime.now()
+                    entry['result'] = result
+                    entry['expiry'] = now + timedelta(seconds=getter(result))
+                    with lock:
+                        evict_expired(now, entry)
+                    return result
         return wrapper
     return inner_fn
 
 
+def get_session(pool_maxsize:int=POOL_MAXSIZE, pool_connections:int=POOL_CONNECTIONS) -> requests.Session:
+    """Returns the session shared by every client.
+    Connections are pooled per host (the least recently used pool is discarded first
+    when there are too many hosts); cookies are never stored, so nothing is shared
+    between clients talking to the same host.
+    Both limits are raised to the given values if needed (never lowered).
+    :param pool_maxsize: the connections to keep alive for each host.
+    :param pool_connections: the number of hosts whose pool is kept.
+    """
+    global _session, _pool_maxsize, _pool_connections
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        if pool_maxsize > _pool_maxsize or pool_connections > _pool_connections:
+            _pool_maxsize = max(pool_maxsize, _pool_maxsize)
+            _pool_connections = max(pool_connections, _pool_connections)
+            adapter = HTTPAdapter(pool_connections=_pool_connections, pool_maxsize=_pool_maxsize)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+class Record(tuple):
+    """A tuple that can also be read by field name, with the original JSON keys:
+    `record["5a1b..."]` always works; `record.title` works only when the key is a valid
+    attribute name that isn't already a tuple/Record member (eg. `count`, `index`, `_fields`).
+    """
+    __slots__ = ()
+    _fields = ()
+    _index = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                key = self._index[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name):
+        try:
+            return tuple.__getitem__(self, self._index[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def _asdict(self) -> dict:
+        return dict(zip(self._fields, self))
+
+    def __reduce__(self):
+        return (_make_record, (self._fields, tuple(self)))
+
+    def __repr__(self):
+        return "Record({})".format(", ".join(f"{field!r}: {value!r}" for field, value in zip(self._fields, self)))
+
+
+@lru_cache(maxsize=None)
+def get_record_type(fields:Sequence[str]) -> type:
+    """Returns a (cached) `Record` type for the given fields."""
+    return type('Record', (Record,), {
+        '__slots__': (),
+        '_fields': fields,
+        '_index': {field: i for i, field in enumerate(fields)},
+    })
+
+
+def _make_record(fields:Sequence[str], values:Sequence) -> Record:
+    """Rebuilds a pickled `Record`."""
+    return get_record_type(fields)(values)
+
+
+def project(records:Iterable[Mapping], fields:Optional[Sequence[str]]=None) -> Iterable:
+    """Reduces each record to the requested fields.
+
+    Every record becomes a `Record` (a tuple, no per-record dict), missing fields are set to None.
+    If `fields` is empty, records are returned untouched.
+    :param records: the parsed JSON objects of a page.
+    :param fields: the names of the fields to keep, in order (a string is a single field).
+    """
+    if not fields:
+        return records
+    if isinstance(fields, str):
+        fields = (fields,)
+    fields = tuple(fields)
+    record_type = get_record_type(fields)
+    return [record_type(record.get(field) for field in fields) for record in records]
+
+
 def common_client(method: str, base_url: str, path:str="/", 
                     parameters:Optional[Mapping]=None, url:Optional[str]=None, headers:Optional[Mapping]=None, 
                     data:Any=None, form_data:Optional[Mapping]=None, files:Optional[Mapping]=None) -> Any:
@@ -98,7 +230,7 @@ def get_complete_url(base_url:str, path:str, parameters:Mapping=None, url:str=No
 
 def get_response(method:str, url:str, headers:Mapping=None, 
                     data:Mapping=None, form_data:Mapping=None, files:Mapping=None) -> requests.Response:
-    response = getattr(requests, method.lower())(url, headers=headers, json=data, data=form_data, files=files)
+    response = get_session().request(method.upper(), url, headers=headers, json=data, data=form_data, files=files)
     logger.debug("Request %s on %s got %s", method, url, response.status_code)
     try:
         response.raise_for_status()
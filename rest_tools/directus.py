@@ -4,7 +4,7 @@ Documentation and reference: https://docs.directus.io/reference/introduction/
 """
 import json
 
-from .common import common_client, GET
+from .common import common_client, project, GET
 
 def get_directus_client(token, base_url):
     """Returns a callable you can use to interact with your Directus instance API
@@ -17,7 +17,7 @@ def get_directus_client(token, base_url):
         'Authorization': f'Bearer {token}',
         "Cache-Control": "no-store"
     }
-    def directus_client(method, path, parameters=None, url=None, data=None, resource=False):
+    def directus_client(method, path, parameters=None, url=None, data=None, resource=False, fields=None):
         _parameters = {**parameters} if parameters else {}
         current_filter = _parameters.pop('filter', None)
         if current_filter:
@@ -38,7 +38,7 @@ def get_directus_client(token, base_url):
                 result = common_client(GET, base_url, path=path, parameters=params, 
                                         headers=headers)
                 filter_count = result['meta']['filter_count']
-                results.extend(result['data'])
+                results.extend(project(result['data'], fields))
                 has_more_items = len(results) < filter_count
 
         else:
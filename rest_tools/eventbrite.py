@@ -3,7 +3,7 @@
 API reference: https://www.eventbrite.com/platform/api
 """
 from typing import Callable
-from .common import common_client, GET
+from .common import common_client, project, GET
 
 def get_eventbrite_client(token:str, base_url:str="https://www.eventbriteapi.com/v3") -> Callable:
     """Returns a callable you can use to interact with Eventbrite API.
@@ -15,7 +15,7 @@ def get_eventbrite_client(token:str, base_url:str="https://www.eventbriteapi.com
 		"Authorization": f"Bearer {token}",
 		"Content-Type": "application/json"
 	}
-    def eventbrite_client(method, path, parameters=None, url=None, data=None, resource=None):
+    def eventbrite_client(method, path, parameters=None, url=None, data=None, resource=None, fields=None):
         """REST tool to interact with Eventbrite API.
 
         The path parameters should always start with a "/" and should NOT include the version (eg: `/events`)
@@ -25,6 +25,7 @@ def get_eventbrite_client(token:str, base_url:str="https://www.eventbriteapi.com
         :param url: if specified, path and parameters will be ignored (this should be a full URL, eg. `https://www.eventbriteapi.com/v3/events`)
         :param data: the optional body content of a POST/PATCH/PUT request. It will be encoded as JSON.
         :param resource: if this is a string & method is GET, the client will request all the paginated content (it will make 1+ requests as needed). 
+        :param fields: if set together with `resource`, every record is reduced to these fields (see `common.project`).
         """
         if method.lower() == GET and resource:
             has_more_items = True
@@ -40,7 +41,7 @@ def get_eventbrite_client(token:str, base_url:str="https://www.eventbriteapi.com
                 has_more_items = result['pagination']['has_more_items']
                 if has_more_items:
                     continuation = result['pagination']['continuation']
-                resources.extend(result[resource])
+                resources.extend(project(result[resource], fields))
             return resources
 
         return common_client(method, base_url, path, parameters, url, headers, data)
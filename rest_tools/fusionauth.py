@@ -2,7 +2,7 @@
 
 API overview: https://fusionauth.io/docs/v1/tech/apis/
 """
-from rest_tools.common import common_client
+from rest_tools.common import common_client, project
 
 DEFAULT_NUMBER_OF_RESULTS = 25
 
@@ -13,7 +13,7 @@ def get_fusionauth_client(api_key:str, base_url:str, number_of_results:int=DEFAU
     :param base_url: the url of your Fusionauth instance
     """
     headers = {'Authorization': api_key}
-    def fusionauth_client(method, path="/", parameters=None, url=None, data=None, resource=None):
+    def fusionauth_client(method, path="/", parameters=None, url=None, data=None, resource=None, fields=None):
         """REST tool to interact with Fusionauth API.
 
         The path parameters should always start with a "/" and should include the word "api" (eg: `/api/user`)
@@ -23,6 +23,7 @@ def get_fusionauth_client(api_key:str, base_url:str, number_of_results:int=DEFAU
         :param url: if specified, path and parameters will be ignored (this should be a full URL, eg. `https://fusionauth.example.com/api/user`)
         :param data: the optional body content of a POST/PATCH/PUT request. It will be encoded as JSON.
         :param resource: if this is a string & method is GET, the client will request all the paginated content (it will make 1+ requests as needed). 
+        :param fields: if set together with `resource`, every record is reduced to these fields (see `common.project`).
         """
         if method == "get" and resource:
             start_row = 0
@@ -37,7 +38,7 @@ def get_fusionauth_client(api_key:str, base_url:str, number_of_results:int=DEFAU
                                         parameters=paged_parameters, headers=headers)
                 if result['total'] == 0:
                     break
-                resources.extend(result[resource])
+                resources.extend(project(result[resource], fields))
                 if len(resources) < result['total']:
                     start_row += number_of_results
                 else:
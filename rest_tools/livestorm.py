@@ -2,7 +2,7 @@
 
 API reference: https://developers.livestorm.co/reference
 """
-from .common import common_client, GET
+from .common import common_client, project, GET
 
 def get_livestorm_client(apikey, base_url="https://api.livestorm.co/v1"):
     """Returns a callable you can use to interact with Livestorm API.
@@ -14,7 +14,7 @@ def get_livestorm_client(apikey, base_url="https://api.livestorm.co/v1"):
 		"accept": "application/vnd.api+json",
 		"Authorization": apikey
 	}
-    def livestorm_client(method, path, parameters=None, url=None, data=None, resource=False):
+    def livestorm_client(method, path, parameters=None, url=None, data=None, resource=False, fields=None):
         """REST tool to interact with Livestorm API.
 
         The path parameters should always start with a "/" and should NOT include the version (eg: `/events`)
@@ -24,6 +24,8 @@ def get_livestorm_client(apikey, base_url="https://api.livestorm.co/v1"):
         :param url: if specified, path and parameters will be ignored (this should be a full URL, eg. `https://api.livestorm.co/v1`)
         :param data: the optional body content of a POST/PATCH/PUT request. It will be encoded as JSON.
         :param resource: if true & method is GET, the client will request all the paginated content (it will make 1+ requests as needed). 
+        :param fields: if set together with `resource`, every record is reduced to these fields (see `common.project`).
+            Records follow JSON:API (`{id, type, attributes}`), so fields are looked up in `attributes`, plus `id`.
         """
         if method.lower() == GET and resource:
             has_more_items = True
@@ -43,7 +45,10 @@ def get_livestorm_client(apikey, base_url="https://api.livestorm.co/v1"):
 
                 current_page += 1
                 has_more_items = page_count > current_page
-                results.extend(result['data'])
+                if fields:
+                    results.extend(project((dict(item['attributes'], id=item['id']) for item in result['data']), fields))
+                else:
+                    results.extend(result['data'])
 
         else:
             response = common_client(method, base_url, path, parameters, url, headers, data)
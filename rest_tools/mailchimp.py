@@ -11,9 +11,7 @@ import tarfile
 import time
 from typing import Any, Callable, Sequence
 
-import requests
-
-from .common import common_client, GET, POST
+from .common import common_client, get_session, project, GET, POST
 
 
 DEFAULT_COUNT = 10
@@ -32,7 +30,7 @@ def get_mailchimp_client(apikey:str, count:int=DEFAULT_COUNT) -> Callable:
         'Authorization': 'Basic {}'.format(b64encode("username:{}".format(apikey).encode('ascii')).decode("ascii"))
     }
 
-    def mailchimp_client(method, path, parameters=None, url=None, data=None, resource=None):
+    def mailchimp_client(method, path, parameters=None, url=None, data=None, resource=None, fields=None):
         """REST tool to interact with Mailchimp API.
 
         The path parameters should always start with a "/" and should NOT include the version (eg: `/campaigns`)
@@ -42,6 +40,7 @@ def get_mailchimp_client(apikey:str, count:int=DEFAULT_COUNT) -> Callable:
         :param url: if specified, path and parameters will be ignored (this should be a full URL, eg. `https://us6.api.mailchimp.com/3.0/campaigns`)
         :param data: the optional body content of a POST/PATCH/PUT request. It will be encoded as JSON.
         :param resource: if true & method is GET, the client will request all the paginated content (it will make 1+ requests as needed). 
+        :param fields: if set together with `resource`, every record is reduced to these fields (see `common.project`).
         """
         if method.lower() == GET and resource:
             results = []
@@ -62,7 +61,7 @@ def get_mailchimp_client(apikey:str, count:int=DEFAULT_COUNT) -> Callable:
                 else:
                     current_resources = []
                 remainder = total_items - len(current_resources) - offset
-                results.extend(current_resources)
+                results.extend(project(current_resources, fields))
                 if remainder:
                     offset = offset + count
             return results
@@ -100,7 +99,7 @@ def get_mailchimp_batch(apikey:str, count:int=DEFAULT_COUNT, patience:int=DEFAUL
             raise TimeoutError(f"Timeout expired while waiting for batch operation {batch['id']}. Last status: {last_status}")
 
         if response_body_url:
-            r = requests.get(response_body_url)
+            r = get_session().get(response_body_url)
 
             with tarfile.open(fileobj=BytesIO(r.content), mode="r") as tar:
                 results = ()
@@ -2,7 +2,7 @@ from typing import Callable
 
 import requests
 
-from .common import common_client, GET, logger
+from .common import common_client, project, GET, logger
 
 def get_pipedrive_client(api_token:str, domain:str) -> Callable:
     """Returns a callable you can use to interact with your instance of Pipedrive.
@@ -12,7 +12,7 @@ def get_pipedrive_client(api_token:str, domain:str) -> Callable:
     :param domain: your company domain
     """
     base_url = f"https://{domain}.pipedrive.com/api/v1"
-    def pipedrive_client(method, path="/", parameters=None, url=None, data=None, resource=None):
+    def pipedrive_client(method, path="/", parameters=None, url=None, data=None, resource=None, fields=None):
         """REST tool to interact with Wordpress API.
 
         :param method: one of the HTTP verb (GET, POST, DELETE,...)
@@ -22,6 +22,7 @@ def get_pipedrive_client(api_token:str, domain:str) -> Callable:
         :param data: the optional body content of a POST/PATCH/PUT request. It will be encoded as JSON.
         :param file_object: an open file-like object that will be uploaded.
         :param resource: if this is a string & method is GET, the client will request all the paginated content (it will make 1+ requests as needed).
+        :param fields: if set together with `resource`, every record is reduced to these fields (see `common.project`).
         """
 
         _params = {**(parameters or {}), 'api_token': api_token}
@@ -46,7 +47,7 @@ def get_pipedrive_client(api_token:str, domain:str) -> Callable:
 
                 current_resources = result['data']
                 requested_start += len(current_resources)
-                resources.extend(current_resources)
+                resources.extend(project(current_resources, fields))
             return resources
         else:
             return common_client(method, base_url,
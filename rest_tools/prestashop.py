@@ -1,13 +1,13 @@
 from base64 import b64encode
 
-from .common import common_client, GET
+from .common import common_client, project, GET
 
 def get_prestashop_client(access_key:str, base_url:str):
     headers = {
         'Authorization': 'Basic {}'.format(b64encode(f"{access_key}:".encode('ascii')).decode("ascii")),
         'Io-Format': 'JSON'
     }
-    def prestashop_client(method, path, parameters=None, url=None, data=None, resource=False):
+    def prestashop_client(method, path, parameters=None, url=None, data=None, resource=False, fields=None):
         if method.lower() == GET and resource:
             has_more_items = True
             index = 0
@@ -23,7 +23,7 @@ def get_prestashop_client(access_key:str, base_url:str):
                 resource_page = result.get(resource, []) if result else []
                 has_more_items = len(resource_page) == number
                 index += number
-                resources.extend(resource_page)
+                resources.extend(project(resource_page, fields))
             return resources
 
         else:
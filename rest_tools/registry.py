@@ -0,0 +1,117 @@
+"""Client registry, for when you talk to many instances (tenants) of the same services.
+
+Every tenant is identified by the provider name and the arguments given to its
+`get_<service>_client` function (base_url and credentials). Clients share the
+connection pools of `common.get_session`, while the registry caps the number of
+concurrent calls, both overall and per tenant, and forgets the tenants that
+haven't been used for a while.
+"""
+from threading import BoundedSemaphore, Lock
+import time
+from typing import Callable, Optional
+
+from .canvas import get_canvas_client
+from .clickup import get_clickup_client
+from .common import get_session, logger
+from .directus import get_directus_client
+from .eventbrite import get_eventbrite_client
+from .fusionauth import get_fusionauth_client
+from .livestorm import get_livestorm_client
+from .mailchimp import get_mailchimp_client
+from .pipedrive import get_pipedrive_client
+from .prestashop import get_prestashop_client
+from .wordpress import get_wordpress_client
+
+
+PROVIDERS = {
+    'canvas': get_canvas_client,
+    'clickup': get_clickup_client,
+    'directus': get_directus_client,
+    'eventbrite': get_eventbrite_client,
+    'fusionauth': get_fusionauth_client,
+    'livestorm': get_livestorm_client,
+    'mailchimp': get_mailchimp_client,
+    'pipedrive': get_pipedrive_client,
+    'prestashop': get_prestashop_client,
+    'wordpress': get_wordpress_client,
+}
+DEFAULT_MAX_CALLS = 50
+DEFAULT_MAX_CALLS_PER_TENANT = 4
+DEFAULT_IDLE_TIMEOUT = 600  # seconds
+DEFAULT_MAX_HOSTS = 1000
+
+
+def get_client_registry(max_calls:int=DEFAULT_MAX_CALLS,
+                        max_calls_per_tenant:int=DEFAULT_MAX_CALLS_PER_TENANT,
+                        idle_timeout:Optional[float]=DEFAULT_IDLE_TIMEOUT,
+                        max_hosts:int=DEFAULT_MAX_HOSTS) -> Callable:
+    """Returns a callable that hands out one client for each tenant.
+
+    :param max_calls: the maximum number of calls in progress, across all the tenants.
+    :param max_calls_per_tenant: the maximum number of calls in progress for a single tenant.
+    :param idle_timeout: seconds after which an unused tenant is evicted (None: never).
+    :param max_hosts: the number of hosts whose connection pool is kept open.
+    """
+    calls = BoundedSemaphore(max_calls)
+    tenants = {}
+    lock = Lock()
+    # every call goes through the registry, so the pools never need more connections per host
+    get_session(pool_maxsize=max_calls, pool_connections=max_hosts)
+
+    def evict_idle_tenants(now):
+        for key, tenant in list(tenants.items()):
+            if not tenant['active'] and now - tenant['last_used'] > idle_timeout:
+                logger.debug("Evicting idle %s client", key[0])
+                del tenants[key]
+
+    def add_tenant(key, tenant_client):
+        tenant = tenants[key] = {
+            'calls': BoundedSemaphore(max_calls_per_tenant),
+            'client': tenant_client,
+            'active': 0,
+            'last_used': time.monotonic(),
+        }
+        return tenant
+
+    def get_tenant_client(key, client):
+        def tenant_client(*args, **kwargs):
+            # the tenant is looked up on each call: a client kept after its eviction
+            # registers again (or joins the newer client), so the per-tenant cap holds
+            with lock:
+                tenant = tenants.get(key) or add_tenant(key, tenant_client)
+                tenant['active'] += 1
+                tenant['last_used'] = time.monotonic()
+            try:
+                with tenant['calls'], calls:
+                    return client(*args, **kwargs)
+            finally:
+                with lock:
+                    tenant['active'] -= 1
+                    tenant['last_used'] = time.monotonic()
+        return tenant_client
+
+    def get_client(provider:str, **client_args) -> Callable:
+        """Returns the client for the tenant, creating it on first use.
+
+        :param provider: one of the keys of `PROVIDERS` (eg.: "wordpress").
+        :param client_args: the arguments of the provider's `get_<service>_client`
+            (eg.: `api_key`, `api_secret`, `base_url`).
+        """
+        try:
+            factory = PROVIDERS[provider]
+        except KeyError:
+            raise ValueError(f"Unknown provider {provider!r}, expected one of: {', '.join(PROVIDERS)}")
+
+        key = (provider, tuple(sorted(client_args.items())))
+        with lock:
+            now = time.monotonic()
+            if idle_timeout is not None:
+                evict_idle_tenants(now)
+            tenant = tenants.get(key)
+            if tenant is None:
+                tenant = add_tenant(key, get_tenant_client(key, factory(**client_args)))
+            else:
+                tenant['last_used'] = now
+            return tenant['client']
+
+    return get_client
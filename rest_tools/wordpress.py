@@ -6,12 +6,12 @@ from typing import Callable
 
 import requests
 
-from .common import common_client, expiring, GET, logger
+from .common import common_client, expiring, get_session, project, GET, logger
 
 
 @expiring(itemgetter('exp'))
 def get_wordpress_access_token(base_url, api_key, api_secret):
-    r = requests.post(f"{base_url}/wp/v2/token", data={'api_key': api_key, 'api_secret': api_secret})
+    r = get_session().post(f"{base_url}/wp/v2/token", data={'api_key': api_key, 'api_secret': api_secret})
     try:
         r.raise_for_status()
     except requests.HTTPError as exc:
@@ -28,7 +28,7 @@ def get_wordpress_client(api_key:str, api_secret:str, base_url:str) -> Callable:
     :param base_url: The installation path of your WP installation; please include `/wp-json` at the end.
     """
 
-    def wordpress_client(method, path="/", parameters=None, url=None, data=None, file_object=None, resource=None):
+    def wordpress_client(method, path="/", parameters=None, url=None, data=None, file_object=None, resource=None, fields=None):
         """REST tool to interact with Wordpress API.
 
         :param method: one of the HTTP verb (GET, POST, DELETE,...)
@@ -38,6 +38,7 @@ def get_wordpress_client(api_key:str, api_secret:str, base_url:str) -> Callable:
         :param data: the optional body content of a POST/PATCH/PUT request. It will be encoded as JSON.
         :param file_object: an open file-like object that will be uploaded.
         :param resource: if this is a string & method is GET, the client will request all the paginated content (it will make 1+ requests as needed). 
+        :param fields: if set together with `resource`, every record is reduced to these fields (see `common.project`).
         """
         token = get_wordpress_access_token(base_url, api_key, api_secret)
         headers = {'Authorization': "Bearer {access_token}".format(access_token=token['access_token'])}
@@ -58,7 +59,7 @@ def get_wordpress_client(api_key:str, api_secret:str, base_url:str) -> Callable:
 
                 current_page += 1
                 has_more_items = total_pages > current_page
-                resources.extend(result[resource])
+                resources.extend(project(result[resource], fields))
             return resources
 
         elif file_object: